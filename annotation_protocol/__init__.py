@@ -5,9 +5,15 @@ and assess the following in addition to whether the `object` is an instance of t
 `classinfo` argument.
 """
 from .annotation_protocol import AnnotationProtocol
+from .cache import invalidate, invalidate_all, set_development_mode
 from .check_annotations import check_annotations
+from .validate_values import validate_values
 
 __all__ = [
     "AnnotationProtocol",
     "check_annotations",
+    "invalidate",
+    "invalidate_all",
+    "set_development_mode",
+    "validate_values",
 ]
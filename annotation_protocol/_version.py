@@ -1,3 +1,3 @@
-__version__ = "1.3.0"
+__version__ = "1.4.0"
 
-__dev_version__ = "1.3.0.dev0"
+__dev_version__ = "1.4.0.dev0"
@@ -4,11 +4,66 @@ from typing import (
     _get_protocol_attrs,
     runtime_checkable,
 )
+from weakref import WeakSet
 
+from .cache import ClassCache, is_development_mode, register_protocol
 from .check_annotations import check_annotations
+from .utils import data_attributes_to_check, get_protocol_signatures
+from .validate_values import validate_values
 
 logger = logging.getLogger(__name__)
 
+# Outcome of `check_annotations` for each protocol and implementing class, and the parent
+# protocols implied by each protocol.
+_CHECKS: ClassCache[bool | type[NotImplemented]] = ClassCache()
+_IMPLIED_PROTOCOLS: ClassCache[list[type]] = ClassCache()
+# Protocols that also validate the values of data attributes of instances.
+_CHECK_VALUES: WeakSet[type] = WeakSet()
+
+
+def _cached_check_annotations(protocol: type, other: type) -> bool | type[NotImplemented]:
+    """Check the annotations of `other` against `protocol`, caching the outcome.
+
+    When `other` adheres to `protocol` it is also recorded to adhere to the implied parent
+    protocols, so their checks are not repeated.
+    """
+
+    def _check() -> bool | type[NotImplemented]:
+        check = check_annotations(protocol, other, _get_protocol_attrs(AnnotationProtocol))
+        if check is True:
+            for parent in _implied_protocols(protocol):
+                _CHECKS.store((parent, other), check)
+        return check
+
+    return _CHECKS.get((protocol, other), _check)
+
+
+def _implied_protocols(protocol: type) -> list[type]:
+    """Get the parent protocols that any class adhering to `protocol` also adheres to.
+
+    These are the parents of which `protocol` does not override any annotations.
+    """
+
+    def _resolve() -> list[type]:
+        signatures = get_protocol_signatures(protocol)
+        annotations = data_attributes_to_check(protocol, set())
+        return [
+            parent
+            for parent in protocol.__mro__[1:]
+            if getattr(parent, "_is_protocol", False)
+            and parent is not AnnotationProtocol
+            and all(
+                signatures[attr] == parent_signature
+                for attr, parent_signature in get_protocol_signatures(parent).items()
+            )
+            and all(
+                annotations.get(attr) == parent_annotation
+                for attr, parent_annotation in data_attributes_to_check(parent, set()).items()
+            )
+        ]
+
+    return _IMPLIED_PROTOCOLS.get((protocol,), _resolve)
+
 
 class _AnnotationProtocolMeta(type(Protocol)):
     def __instancecheck__(cls, instance: object) -> bool:
@@ -23,25 +78,48 @@ class _AnnotationProtocolMeta(type(Protocol)):
                     logger.debug(msg)
                     return super().__instancecheck__(instance)
             # instance may actually be a proper class rather than an instance
-            check = check_annotations(
+            check = _cached_check_annotations(
                 cls,
                 instance if isinstance(instance, type) else instance.__class__,
-                _get_protocol_attrs(AnnotationProtocol),
             )
+            if check is True and cls in _CHECK_VALUES and not isinstance(instance, type):
+                return not validate_values(cls, [instance])
             if isinstance(check, bool):
                 return check
         return super(type(Protocol), cls).__instancecheck__(instance)
 
+    def __subclasscheck__(cls, other: type) -> bool:
+        # `abc` caches outcomes of the subclasshook, which go stale when classes are mutated
+        if is_development_mode() and getattr(cls, "_is_protocol", False):
+            cls._abc_caches_clear()
+        return super().__subclasscheck__(other)
+
 
 class AnnotationProtocol(Protocol, metaclass=_AnnotationProtocolMeta):
     """Protocol that checks attribute and function annotations."""
 
-    def __init_subclass__(cls) -> None:
-        """Override subclasshook to also do annotation checking."""
+    def __init_subclass__(cls, *, check_values: bool | None = None) -> None:
+        """Override subclasshook to also do annotation checking.
+
+        With `check_values`, `isinstance` also validates the values of the annotated data
+        attributes of an instance, see `validate_values`. When it is not given, it is inherited
+        from the protocol bases.
+        """
+        # Like `typing`, only classes that list the protocol base explicitly are protocols, e.g.
+        # `class Child(Parent, AnnotationProtocol)`, other subclasses are nominal implementations
         cls._is_protocol = any(  # type: ignore[attr-defined]
-            b is AnnotationProtocol for b in cls.__bases__
+            b is AnnotationProtocol or b is Protocol for b in cls.__bases__
         )
+        if not cls._is_protocol:  # type: ignore[attr-defined]
+            super().__init_subclass__()
+            return
+
         runtime_checkable(cls)
+        register_protocol(cls)
+        if check_values is None:
+            check_values = any(base in _CHECK_VALUES for base in cls.__bases__)
+        if check_values:
+            _CHECK_VALUES.add(cls)
         super().__init_subclass__()
 
         # Save the usual __subclasshook__ from Protocol to check first
@@ -52,6 +130,6 @@ class AnnotationProtocol(Protocol, metaclass=_AnnotationProtocolMeta):
             ignore_annotations_check = ignore_annotations_subclasshook(other)
             if ignore_annotations_check is not True:
                 return ignore_annotations_check
-            return check_annotations(cls, other, _get_protocol_attrs(AnnotationProtocol))
+            return _cached_check_annotations(cls, other)
 
         cls.__subclasshook__ = _annotation_strict_subclasshook  # type: ignore[attr-defined]
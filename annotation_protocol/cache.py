@@ -0,0 +1,248 @@
+"""Versioned caches of resolved annotations and annotation checks.
+
+The caches are keyed on classes and only hold weak references to them. Entries are dropped with
+`invalidate` when a class is mutated, or with `invalidate_all`. In development mode each entry also
+stores a fingerprint of the classes it was computed from and is recomputed lazily when any of those
+classes has been mutated since, e.g. by monkeypatching a method in a test suite. Fingerprints only
+hold weak references to the values in a class that could refer back to it.
+"""
+import logging
+from collections.abc import Callable, Generator
+from types import GetSetDescriptorType, MemberDescriptorType
+from typing import Generic, TypeVar
+from weakref import WeakKeyDictionary, WeakSet, ref
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_CACHES: list["ClassCache"] = []
+_CLEAR_HOOKS: list[Callable[[], None]] = []
+_PROTOCOLS: WeakSet[type] = WeakSet()
+_MISSING = object()
+_development_mode = False
+# The descriptors in these attributes refer back to their class and are never reassigned, the
+# annotations are fingerprinted one by one.
+_UNVERSIONED = frozenset(("__dict__", "__weakref__", "__annotations__"))
+
+
+def fingerprint(cls: type) -> tuple[object, ...]:
+    """Get a cheap fingerprint of the `__dict__` entries along the MRO of a class.
+
+    The fingerprint changes when an attribute is added, removed or reassigned in any class of the
+    MRO, or when an annotation is changed in place. It does not hold ids, which are reused once a
+    value is freed, nor strong references to values that could refer back to the class, see
+    `_token`. Compare fingerprints with `same_fingerprint`.
+
+    Attributes
+    ----------
+        cls (type): the class to get the fingerprint of.
+
+    Returns
+    -------
+        tuple[object, ...]: the fingerprint.
+    """
+    return (
+        _token(cls.__mro__[1:]),
+        *(
+            (
+                tuple(
+                    (attr, _token(value))
+                    for attr, value in vars(base).items()
+                    if attr not in _UNVERSIONED
+                ),
+                tuple(
+                    (attr, _token(annotation))
+                    for attr, annotation in vars(base).get("__annotations__", {}).items()
+                ),
+            )
+            for base in cls.__mro__
+        ),
+    )
+
+
+def _token(value: object) -> object:
+    """Get a token of a value that is only identical for the same value.
+
+    Values are weakly referenced when possible, so e.g. a method with a `__class__` cell does not
+    keep its class alive. Wrappers that cannot be weakly referenced are unwrapped first.
+    """
+    if type(value) is tuple:
+        return tuple(map(_token, value))
+    if isinstance(value, staticmethod | classmethod):
+        return (type(value), _token(value.__func__))
+    if isinstance(value, property):
+        return (property, _token(value.fget), _token(value.fset), _token(value.fdel))
+    if isinstance(value, MemberDescriptorType | GetSetDescriptorType):
+        return (type(value), ref(value.__objclass__), value.__name__)
+    try:
+        return ref(value)
+    except TypeError:
+        return value
+
+
+def same_fingerprint(version: object, other: object) -> bool:
+    """Check whether two fingerprints hold identical values.
+
+    Attributes
+    ----------
+        version (object): a fingerprint, or a tuple of fingerprints.
+        other (object): the fingerprint to compare with.
+
+    Returns
+    -------
+        bool: True when all values are identical and all names are equal.
+    """
+    if isinstance(version, ref) and isinstance(other, ref):
+        return (value := version()) is not None and value is other()
+    if version is other or (isinstance(version, str) and version == other):
+        return True
+    if type(version) is not tuple or type(other) is not tuple:
+        return False
+    return len(version) == len(other) and all(map(same_fingerprint, version, other))
+
+
+def set_development_mode(enabled: bool) -> None:  # noqa: FBT001
+    """Enable or disable re-validating cached entries against the fingerprint of their classes.
+
+    Attributes
+    ----------
+        enabled (bool): whether development mode is enabled.
+    """
+    global _development_mode  # noqa: PLW0603
+    _development_mode = enabled
+    invalidate_all()
+
+
+def is_development_mode() -> bool:
+    """Return whether development mode is enabled."""
+    return _development_mode
+
+
+def register_protocol(protocol: type) -> None:
+    """Register a protocol so its `issubclass` cache is cleared on invalidation.
+
+    Attributes
+    ----------
+        protocol (type): the protocol to register.
+    """
+    _PROTOCOLS.add(protocol)
+
+
+def register_clear_hook(clear: Callable[[], None]) -> None:
+    """Register a function that clears a cache that is not keyed on classes, e.g. a memo.
+
+    Attributes
+    ----------
+        clear (Callable[[], None]): called by `invalidate_all`.
+    """
+    _CLEAR_HOOKS.append(clear)
+
+
+def invalidate(cls: type) -> None:
+    """Drop all cached entries computed from a class or any of its subclasses.
+
+    Attributes
+    ----------
+        cls (type): the class that was mutated.
+    """
+    for subclass in _subclasses(cls):
+        for cache in _CACHES:
+            cache.discard(subclass)
+    _clear_protocol_caches()
+
+
+def invalidate_all() -> None:
+    """Drop all cached entries."""
+    for cache in _CACHES:
+        cache.clear()
+    for clear in _CLEAR_HOOKS:
+        clear()
+    _clear_protocol_caches()
+
+
+def _subclasses(cls: type) -> Generator[type, None, None]:
+    """Generate a class and all of its (indirect) subclasses."""
+    yield cls
+    for subclass in type.__subclasses__(cls):
+        yield from _subclasses(subclass)
+
+
+def _clear_protocol_caches() -> None:
+    """Clear the positive and negative `issubclass` caches kept by `abc` for each protocol."""
+    for protocol in _PROTOCOLS:
+        protocol._abc_caches_clear()  # noqa: SLF001
+
+
+class ClassCache(Generic[T]):
+    """Cache values computed from a fixed number of classes.
+
+    Entries are stored in nested weak dictionaries with one level for each class in the key.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty cache and register it for invalidation."""
+        self._entries: WeakKeyDictionary = WeakKeyDictionary()
+        _CACHES.append(self)
+
+    def get(self, classes: tuple[type, ...], compute: Callable[[], T]) -> T:
+        """Get the cached value for the classes, computing and storing it when needed.
+
+        Attributes
+        ----------
+            classes (tuple[type, ...]): the classes the value is computed from.
+            compute (Callable[[], T]): computes the value when it is not cached or stale.
+
+        Returns
+        -------
+            T: the cached or computed value.
+        """
+        entries = self._nested_entries(classes)
+        version = tuple(map(fingerprint, classes)) if _development_mode else None
+        entry = entries.get(classes[-1], _MISSING)
+        if entry is not _MISSING and same_fingerprint(entry[0], version):
+            return entry[1]
+
+        if entry is not _MISSING:
+            msg = f"Cached entry for {classes} is stale, recomputing."
+            logger.debug(msg)
+        value = compute()
+        entries[classes[-1]] = (version, value)
+        return value
+
+    def store(self, classes: tuple[type, ...], value: T) -> None:
+        """Store a value for the classes.
+
+        Attributes
+        ----------
+            classes (tuple[type, ...]): the classes the value is computed from.
+            value (T): the value to store.
+        """
+        version = tuple(map(fingerprint, classes)) if _development_mode else None
+        self._nested_entries(classes)[classes[-1]] = (version, value)
+
+    def discard(self, cls: type) -> None:
+        """Drop all entries that were computed from a class.
+
+        Attributes
+        ----------
+            cls (type): the class to drop the entries of.
+        """
+        pending = [self._entries]
+        while pending:
+            entries = pending.pop()
+            entries.pop(cls, None)
+            pending.extend(v for v in entries.values() if isinstance(v, WeakKeyDictionary))
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def _nested_entries(self, classes: tuple[type, ...]) -> WeakKeyDictionary:
+        """Get the innermost dictionary of entries for the classes, creating it when needed."""
+        entries = self._entries
+        for cls in classes[:-1]:
+            if (nested := entries.get(cls)) is None:
+                nested = entries[cls] = WeakKeyDictionary()
+            entries = nested
+        return entries
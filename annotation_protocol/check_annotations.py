@@ -4,6 +4,7 @@ from inspect import Signature
 from .utils import (
     argument_annotations_equal,
     attributes_to_check,
+    data_annotations_equal,
     get_signature,
     return_annotations_equal,
 )
@@ -61,4 +62,4 @@ def check_annotations(
         logger.debug(msg)
         if not (compare := compare_signatures(protocol_signature, other_signature)):
             return compare
-    return True
+    return data_annotations_equal(protocol, other, ignore_attributes)
@@ -0,0 +1,676 @@
+"""Scan source files for classes that adhere to annotation protocols, without importing them.
+
+Source files are parsed with `ast` into summaries of their imports and classes, in parallel and
+with an incremental cache keyed by the hash of each file. Annotations are then evaluated
+statically: names from `builtins`, `typing`, `collections.abc` and `types` resolve to the real
+objects, any other name resolves to a placeholder class for its fully qualified name. The resulting
+signatures are compared with the same rules as `compare_signatures` and `compare_annotations`.
+
+Classes are only reported as candidates for a protocol when they define all of its attributes.
+
+Run `annotation-protocol-scan PATH [PATH ...]` or `python -m annotation_protocol.scan --help`.
+"""
+import argparse
+import ast
+import builtins
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from inspect import Parameter, Signature, _ParameterKind
+from pathlib import Path
+from types import GenericAlias, NoneType
+from typing import Annotated, Literal, Union
+
+from .check_annotations import compare_signatures
+from .utils import compare_annotations
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+DEFAULT_CACHE = ".annotation_protocol_cache.json"
+# Modules whose objects are used for annotations, all other names become placeholders
+ANNOTATION_MODULES = ("builtins", "typing", "typing_extensions", "collections.abc", "types")
+PROTOCOL_BASES = {
+    "annotation_protocol.AnnotationProtocol",
+    "annotation_protocol.annotation_protocol.AnnotationProtocol",
+}
+TYPING_PROTOCOLS = {"typing.Protocol", "typing_extensions.Protocol"}
+# Attributes that are not part of a protocol, like `typing._get_protocol_attrs` excludes them
+EXCLUDED_ATTRIBUTES = {
+    "__annotations__",
+    "__dict__",
+    "__doc__",
+    "__init__",
+    "__init_subclass__",
+    "__module__",
+    "__new__",
+    "__qualname__",
+    "__slots__",
+    "__subclasshook__",
+    "__weakref__",
+}
+
+
+@dataclass(frozen=True)
+class ScanResult:
+    """Outcome of the static check of a class against a protocol.
+
+    Attributes
+    ----------
+        protocol (str): qualified name of the protocol.
+        candidate (str): qualified name of the class that defines all attributes of the protocol.
+        adheres (bool): whether the class adheres to the protocol.
+        attribute (str | None): the first attribute that does not adhere, if any.
+    """
+
+    protocol: str
+    candidate: str
+    adheres: bool
+    attribute: str | None = None
+
+
+def summarize_source(source: str | bytes) -> dict:
+    """Summarize the imports, type aliases and classes of a module's source for the static check.
+
+    The summary only contains strings, numbers and lists, so it can be cached as JSON. Type aliases
+    are simple module level assignments of annotations, e.g. `IntOrStr = int | str`, or any
+    assignment annotated with `TypeAlias`.
+
+    Attributes
+    ----------
+        source (str | bytes): the source of the module, bytes are decoded like the interpreter
+            does, respecting a PEP 263 coding declaration.
+
+    Returns
+    -------
+        dict: the imports, aliases and classes of the module, or the error when it cannot be
+            parsed.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError) as e:
+        return {"error": str(e)}
+
+    imports, aliases, classes = {}, {}, {}
+    for node in _module_statements(tree.body):
+        match node:
+            case ast.Import():
+                for alias in node.names:
+                    if alias.asname:
+                        imports[alias.asname] = [0, alias.name]
+                    else:
+                        head = alias.name.split(".")[0]
+                        imports[head] = [0, head]
+            case ast.ImportFrom():
+                for alias in node.names:
+                    dotted = f"{node.module}.{alias.name}" if node.module else alias.name
+                    imports[alias.asname or alias.name] = [node.level, dotted]
+            case ast.ClassDef():
+                classes[node.name] = _summarize_class(node)
+            case ast.Assign(targets=[ast.Name(id=name)], value=value) if _is_annotation(value):
+                aliases[name] = ast.unparse(value)
+            case ast.AnnAssign(target=ast.Name(id=name), value=value) if value is not None and (
+                ast.unparse(node.annotation).split(".")[-1] == "TypeAlias"
+            ):
+                aliases[name] = ast.unparse(value)
+    return {"imports": imports, "aliases": aliases, "classes": classes}
+
+
+def _is_annotation(node: ast.expr) -> bool:
+    """Whether an expression looks like an annotation, e.g. `int | str` or `dict[str, int]`."""
+    match node:
+        case ast.BinOp(op=ast.BitOr()):
+            return _is_annotation(node.left) and _is_annotation(node.right)
+        case ast.Constant(value=None):
+            return True
+    return isinstance(node, ast.Name | ast.Attribute | ast.Subscript)
+
+
+def _module_statements(body: list[ast.stmt]) -> Iterable[ast.stmt]:
+    """Generate module level statements, including those in `if` and `try` blocks."""
+    for node in body:
+        yield node
+        if isinstance(node, ast.If | ast.Try):
+            for block in (node.body, node.orelse, getattr(node, "finalbody", [])):
+                yield from _module_statements(block)
+            for handler in getattr(node, "handlers", []):
+                yield from _module_statements(handler.body)
+
+
+def _summarize_class(node: ast.ClassDef) -> dict:
+    """Summarize the bases, methods and data attributes of a class definition."""
+    summary = {
+        "bases": [ast.unparse(base) for base in node.bases],
+        "methods": {},
+        "data": {},
+        "attributes": [],
+        "instance_attributes": [],
+    }
+    for stmt in node.body:
+        match stmt:
+            case ast.FunctionDef() | ast.AsyncFunctionDef():
+                _summarize_function(stmt, summary)
+            case ast.AnnAssign(target=ast.Name(id=name)):
+                summary["data"][name] = ast.unparse(stmt.annotation)
+            case ast.Assign():
+                summary["attributes"].extend(
+                    target.id for target in stmt.targets if isinstance(target, ast.Name)
+                )
+    return summary
+
+
+def _summarize_function(node: ast.FunctionDef | ast.AsyncFunctionDef, summary: dict) -> None:
+    """Add a method, or property, and the instance attributes it assigns to a class summary."""
+    decorators = [ast.unparse(decorator).split(".")[-1] for decorator in node.decorator_list]
+    if "setter" in decorators or "deleter" in decorators:
+        return
+    returns = ast.unparse(node.returns) if node.returns else None
+    if "property" in decorators or "cached_property" in decorators:
+        summary["data"][node.name] = returns
+    else:
+        kind = next((d for d in decorators if d in ("staticmethod", "classmethod")), "method")
+        summary["methods"][node.name] = {
+            "kind": kind,
+            "parameters": _summarize_parameters(node.args),
+            "returns": returns,
+        }
+
+    arguments = node.args.posonlyargs + node.args.args
+    if not arguments or "staticmethod" in decorators:
+        return
+    instance = arguments[0].arg
+    for child in ast.walk(node):
+        targets = child.targets if isinstance(child, ast.Assign) else [getattr(child, "target", 0)]
+        summary["instance_attributes"].extend(
+            target.attr
+            for target in targets
+            if isinstance(target, ast.Attribute)
+            and isinstance(target.value, ast.Name)
+            and target.value.id == instance
+        )
+
+
+def _summarize_parameters(arguments: ast.arguments) -> list[list]:
+    """Summarize parameters as their name, kind, annotation and whether they have a default."""
+    positional = [(arg, Parameter.POSITIONAL_ONLY) for arg in arguments.posonlyargs]
+    positional += [(arg, Parameter.POSITIONAL_OR_KEYWORD) for arg in arguments.args]
+    n_without_default = len(positional) - len(arguments.defaults)
+    parameters = [
+        (arg, kind, i >= n_without_default) for i, (arg, kind) in enumerate(positional)
+    ]
+    if arguments.vararg:
+        parameters.append((arguments.vararg, Parameter.VAR_POSITIONAL, False))
+    parameters += [
+        (arg, Parameter.KEYWORD_ONLY, default is not None)
+        for arg, default in zip(arguments.kwonlyargs, arguments.kw_defaults, strict=True)
+    ]
+    if arguments.kwarg:
+        parameters.append((arguments.kwarg, Parameter.VAR_KEYWORD, False))
+    return [
+        [arg.arg, kind.name, ast.unparse(arg.annotation) if arg.annotation else None, default]
+        for arg, kind, default in parameters
+    ]
+
+
+def module_name(path: Path) -> str:
+    """Get the name of the module of a file, following the packages it is in.
+
+    Attributes
+    ----------
+        path (Path): the path of the source file.
+
+    Returns
+    -------
+        str: the dotted name of the module.
+    """
+    path = path.resolve()
+    parts = [] if path.stem == "__init__" else [path.stem]
+    directory = path.parent
+    while (directory / "__init__.py").exists():
+        parts.insert(0, directory.name)
+        directory = directory.parent
+    return ".".join(parts) or path.parent.name
+
+
+def _unique_module_name(path: Path, taken: dict[str, dict]) -> str:
+    """Get the module name of a file, prefixed with its directories when the name is taken.
+
+    Files outside packages with the same name, e.g. `conftest.py` in different directories, would
+    otherwise map to the same module.
+    """
+    name = module_name(path)
+    directory = path.resolve().parents[name.count(".") + (path.stem == "__init__")]
+    while name in taken and directory.name:
+        name = f"{directory.name}.{name}"
+        directory = directory.parent
+    if name in taken:
+        name = str(path.resolve())
+    if name != module_name(path):
+        msg = f"Module {module_name(path)} of {path} is taken by another file, using {name}."
+        logger.warning(msg)
+    return name
+
+
+def _summarize_file(path: str) -> tuple[str, dict]:
+    """Summarize a source file, returning the hash of its content with the summary."""
+    content = Path(path).read_bytes()
+    return hashlib.sha256(content).hexdigest(), summarize_source(content)
+
+
+def summarize_files(
+    paths: list[Path],
+    cache_path: Path | None = None,
+    jobs: int | None = None,
+) -> dict[Path, dict]:
+    """Summarize source files in parallel, reusing cached summaries of unchanged files.
+
+    Attributes
+    ----------
+        paths (list[Path]): the source files to summarize.
+        cache_path (Path | None): JSON file to cache the summaries in, no cache if None.
+        jobs (int | None): number of processes, the number of CPUs if None.
+
+    Returns
+    -------
+        dict[Path, dict]: the summary of each file.
+    """
+    cache = _load_cache(cache_path)
+    summaries, stale = {}, []
+    for path in paths:
+        entry = cache.get(str(path))
+        if entry and entry["hash"] == hashlib.sha256(path.read_bytes()).hexdigest():
+            summaries[path] = entry["summary"]
+        else:
+            stale.append(path)
+
+    msg = f"Summarizing {len(stale)} of {len(paths)} files, the others are cached."
+    logger.info(msg)
+    if jobs == 1 or len(stale) <= 1:
+        results = map(_summarize_file, map(str, stale))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_summarize_file, map(str, stale), chunksize=16))
+    for path, (digest, summary) in zip(stale, results, strict=True):
+        cache[str(path)] = {"hash": digest, "summary": summary}
+        summaries[path] = summary
+
+    if cache_path is not None and stale:
+        files = {str(path): cache[str(path)] for path in paths}
+        cache_path.write_text(json.dumps({"version": CACHE_VERSION, "files": files}))
+    return summaries
+
+
+def _load_cache(cache_path: Path | None) -> dict:
+    """Load the cached summaries, ignoring caches of other versions."""
+    if cache_path is None or not cache_path.exists():
+        return {}
+    try:
+        cache = json.loads(cache_path.read_text())
+    except json.JSONDecodeError:
+        msg = f"Ignoring invalid cache {cache_path}."
+        logger.warning(msg)
+        return {}
+    return cache["files"] if cache.get("version") == CACHE_VERSION else {}
+
+
+class _StaticResolver:
+    """Resolve names, annotations and signatures from the summaries of modules."""
+
+    def __init__(self, summaries: dict[str, dict]) -> None:
+        self.modules = summaries
+        self.classes = {
+            f"{module}.{name}": (module, summary)
+            for module, module_summary in summaries.items()
+            for name, summary in module_summary.get("classes", {}).items()
+        }
+        self._placeholders: dict[str, type] = {}
+        self._resolved: dict[str, dict] = {}
+        self._aliases: dict[str, object] = {}
+
+    def qualify(self, module: str, dotted: str) -> str:
+        """Get the fully qualified name of a dotted name used in a module."""
+        head, _, rest = dotted.partition(".")
+        summary = self.modules[module]
+        if head in summary.get("imports", {}):
+            level, imported = summary["imports"][head]
+            qualified = self._absolute(module, level, imported)
+        elif (
+            head not in summary.get("classes", {})
+            and head not in summary.get("aliases", {})
+            and hasattr(builtins, head)
+        ):
+            qualified = f"builtins.{head}"
+        else:
+            qualified = f"{module}.{head}"
+        return self._canonical(f"{qualified}.{rest}" if rest else qualified)
+
+    def _absolute(self, module: str, level: int, dotted: str) -> str:
+        """Get the absolute name of a, possibly relative, import in a module."""
+        if not level:
+            return dotted
+        is_package = self.modules[module].get("is_package", False)
+        package = module.split(".")[: None if is_package else -1]
+        package = package[: len(package) - level + 1]
+        return ".".join([*package, dotted])
+
+    def _canonical(self, qualified: str, depth: int = 0) -> str:
+        """Follow re-exports of names through the imports of the scanned modules."""
+        parts = qualified.split(".")
+        for i in range(len(parts) - 1, 0, -1):
+            module = ".".join(parts[:i])
+            if module not in self.modules:
+                continue
+            summary = self.modules[module]
+            name = parts[i]
+            imports = summary.get("imports", {})
+            is_defined = name in summary["classes"] or name in summary.get("aliases", {})
+            if depth < 10 and name in imports and not is_defined:  # noqa: PLR2004
+                level, imported = imports[name]
+                target = ".".join([self._absolute(module, level, imported), *parts[i + 1 :]])
+                return self._canonical(target, depth + 1)
+            break
+        return qualified
+
+    def resolve_object(self, qualified: str) -> object:
+        """Get the object of a qualified name in an annotation module or a type alias.
+
+        Any other name, e.g. of a class, resolves to a placeholder.
+        """
+        module, _, name = qualified.rpartition(".")
+        if name in self.modules.get(module, {}).get("aliases", {}):
+            return self.resolve_alias(module, name)
+        for module in ANNOTATION_MODULES:
+            if not qualified.startswith(f"{module}."):
+                continue
+            try:
+                obj = importlib.import_module(module)
+                for attr in qualified[len(module) + 1 :].split("."):
+                    obj = getattr(obj, attr)
+            except (ImportError, AttributeError):
+                break
+            else:
+                return obj
+        return self.placeholder(qualified)
+
+    def resolve_alias(self, module: str, name: str) -> object:
+        """Evaluate a type alias of a module, a placeholder when it refers to itself."""
+        qualified = f"{module}.{name}"
+        if qualified not in self._aliases:
+            # Recursive aliases, e.g. `Tree = list["Tree"]`, resolve to a placeholder inside
+            self._aliases[qualified] = self.placeholder(qualified)
+            alias = self.annotation(module, self.modules[module]["aliases"][name])
+            self._aliases[qualified] = alias
+        return self._aliases[qualified]
+
+    def placeholder(self, qualified: str) -> type:
+        """Get the placeholder class of a qualified name, which is the same for each call."""
+        if qualified not in self._placeholders:
+            module, _, name = qualified.rpartition(".")
+            namespace = {"__module__": module, "__class_getitem__": classmethod(GenericAlias)}
+            self._placeholders[qualified] = type(name or qualified, (), namespace)
+        return self._placeholders[qualified]
+
+    def _fallback(self, module: str, node: ast.expr | str) -> type:
+        """Get the placeholder of an annotation that cannot be evaluated, unique to its module."""
+        source = node if isinstance(node, str) else ast.unparse(node)
+        if f"{module}:{source}" not in self._placeholders:
+            namespace = {"__module__": module, "__class_getitem__": classmethod(GenericAlias)}
+            self._placeholders[f"{module}:{source}"] = type(source, (), namespace)
+        return self._placeholders[f"{module}:{source}"]
+
+    def annotation(self, module: str, source: str | None) -> object:
+        """Evaluate the source of an annotation statically."""
+        if source is None:
+            return Parameter.empty
+        try:
+            return self._evaluate(module, ast.parse(source, mode="eval").body)
+        except SyntaxError:
+            return self._fallback(module, source)
+
+    def _evaluate(self, module: str, node: ast.expr) -> object:  # noqa: PLR0911
+        """Evaluate an annotation expression, with placeholders for what is not known."""
+        match node:
+            case ast.Constant(value=str() as value):
+                return self.annotation(module, value)
+            case ast.Constant(value=value):
+                return value
+            case ast.Name() | ast.Attribute():
+                return self.resolve_object(self.qualify(module, ast.unparse(node)))
+            case ast.List(elts=elements):
+                return [self._evaluate(module, element) for element in elements]
+            case ast.Tuple(elts=elements):
+                return tuple(self._evaluate(module, element) for element in elements)
+            case ast.BinOp(op=ast.BitOr()):
+                left, right = self._evaluate(module, node.left), self._evaluate(module, node.right)
+                try:
+                    return Union[NoneType if left is None else left, right]  # noqa: UP007
+                except TypeError:
+                    return self._fallback(module, node)
+            case ast.Subscript():
+                return self._subscript(module, node)
+        return self._fallback(module, node)
+
+    def _subscript(self, module: str, node: ast.Subscript) -> object:
+        """Evaluate a subscripted annotation, e.g. `dict[str, int]`."""
+        origin = self._evaluate(module, node.value)
+        elements = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+        try:
+            if origin is Literal:
+                args = [self._literal(module, element) for element in elements]
+            elif origin is Annotated:
+                metadata = [ast.unparse(element) for element in elements[1:]]
+                args = [self._evaluate(module, elements[0]), *metadata]
+            else:
+                args = [self._evaluate(module, element) for element in elements]
+            return origin[tuple(args) if isinstance(node.slice, ast.Tuple) else args[0]]
+        except (TypeError, ValueError):
+            return self._fallback(module, node)
+
+    def _literal(self, module: str, node: ast.expr) -> object:
+        """Evaluate a `Literal` value, names like `Color.RED` become placeholders of their name."""
+        if isinstance(node, ast.Name | ast.Attribute):
+            return self.placeholder(self.qualify(module, ast.unparse(node)))
+        return ast.literal_eval(node)
+
+    def signature(self, module: str, method: dict) -> Signature:
+        """Build the signature of a method, like `getattr` on its class would give it."""
+        parameters = [
+            Parameter(
+                name,
+                _ParameterKind[kind],
+                default=... if has_default else Parameter.empty,
+                annotation=self.annotation(module, annotation),
+            )
+            for name, kind, annotation, has_default in method["parameters"]
+        ]
+        if method["kind"] == "classmethod":
+            parameters = parameters[1:]
+        return Signature(parameters, return_annotation=self.annotation(module, method["returns"]))
+
+    def mro(self, qualified: str) -> list[str]:
+        """Get the MRO of a class, with only the bases that are scanned classes."""
+        module, summary = self.classes[qualified]
+        bases = [self.qualify(module, base) for base in summary["bases"]]
+        sequences = [self.mro(base) for base in bases if base in self.classes]
+        sequences.append([base for base in bases if base in self.classes])
+        mro = [qualified]
+        while sequences := [sequence for sequence in sequences if sequence]:
+            for sequence in sequences:
+                head = sequence[0]
+                if not any(head in other[1:] for other in sequences):
+                    break
+            else:
+                msg = f"Inconsistent MRO for {qualified}, using the first bases first."
+                logger.debug(msg)
+                head = sequences[0][0]
+            mro.append(head)
+            sequences = [[cls for cls in sequence if cls != head] for sequence in sequences]
+        return mro
+
+    def is_protocol(self, qualified: str) -> bool:
+        """Whether a class is an annotation protocol.
+
+        Like at runtime, only classes that list `AnnotationProtocol` as a base, or `Protocol` next
+        to an annotation protocol, are protocols. Other subclasses are nominal implementations.
+        """
+        module, summary = self.classes[qualified]
+        bases = {self.qualify(module, base) for base in summary["bases"]}
+        if bases & PROTOCOL_BASES:
+            return True
+        return bool(bases & TYPING_PROTOCOLS) and any(
+            base in self.classes and base != qualified and self.is_protocol(base) for base in bases
+        )
+
+    def resolve(self, qualified: str) -> dict:
+        """Resolve the attributes, signatures and data annotations of a class along its MRO."""
+        if qualified in self._resolved:
+            return self._resolved[qualified]
+        attributes, instance_attributes = set(), set()
+        signatures, data = {}, {}
+        for cls in reversed(self.mro(qualified)):
+            module, summary = self.classes[cls]
+            for name, method in summary["methods"].items():
+                signatures[name] = self.signature(module, method)
+                data.pop(name, None)
+            for name, annotation in summary["data"].items():
+                signatures[name] = None
+                resolved = self.annotation(module, annotation)
+                data[name] = NoneType if resolved is None else resolved
+            for name in summary["attributes"]:
+                signatures.setdefault(name, None)
+            attributes |= {*summary["methods"], *summary["data"], *summary["attributes"]}
+            instance_attributes |= set(summary["instance_attributes"])
+
+        resolved = {
+            "attributes": attributes - EXCLUDED_ATTRIBUTES,
+            "instance_attributes": instance_attributes,
+            "signatures": signatures,
+            "data": {name: a for name, a in data.items() if a is not Parameter.empty},
+        }
+        self._resolved[qualified] = resolved
+        return resolved
+
+
+def check_class(resolver: _StaticResolver, protocol: str, candidate: str) -> ScanResult | None:
+    """Check a class against a protocol statically.
+
+    Attributes
+    ----------
+        resolver (_StaticResolver): resolves the scanned modules.
+        protocol (str): qualified name of the protocol.
+        candidate (str): qualified name of the class that should adhere to the protocol.
+
+    Returns
+    -------
+        ScanResult | None: the outcome, None if the class does not define all attributes.
+    """
+    protocol_info, other = resolver.resolve(protocol), resolver.resolve(candidate)
+    if not protocol_info["attributes"] <= other["attributes"] | other["instance_attributes"]:
+        return None
+
+    for attr in sorted(protocol_info["attributes"]):
+        if (protocol_signature := protocol_info["signatures"].get(attr)) is None:
+            continue
+        other_signature = other["signatures"].get(attr)
+        if other_signature is None or not compare_signatures(protocol_signature, other_signature):
+            return ScanResult(protocol, candidate, adheres=False, attribute=attr)
+
+    for attr, annotation in sorted(protocol_info["data"].items()):
+        if attr in other["data"] and not compare_annotations(annotation, other["data"][attr]):
+            return ScanResult(protocol, candidate, adheres=False, attribute=attr)
+    return ScanResult(protocol, candidate, adheres=True)
+
+
+def scan(
+    paths: list[Path],
+    cache_path: Path | None = None,
+    jobs: int | None = None,
+) -> list[ScanResult]:
+    """Check all classes in the source files against all protocols in them, without importing.
+
+    Attributes
+    ----------
+        paths (list[Path]): source files and directories to scan recursively.
+        cache_path (Path | None): JSON file to cache the file summaries in, no cache if None.
+        jobs (int | None): number of processes, the number of CPUs if None.
+
+    Returns
+    -------
+        list[ScanResult]: the outcome for each protocol and each class that is a candidate for it.
+    """
+    files = sorted(set(_source_files(paths)))
+    summaries = {}
+    for path, summary in summarize_files(files, cache_path, jobs).items():
+        if "error" in summary:
+            msg = f"Skipping {path}: {summary['error']}"
+            logger.warning(msg)
+            continue
+        name = _unique_module_name(path, summaries)
+        summaries[name] = {**summary, "is_package": path.stem == "__init__"}
+
+    resolver = _StaticResolver(summaries)
+    protocols = [cls for cls in resolver.classes if resolver.is_protocol(cls)]
+    candidates = [cls for cls in resolver.classes if cls not in protocols]
+    results = (
+        check_class(resolver, protocol, candidate)
+        for protocol in sorted(protocols)
+        for candidate in sorted(candidates)
+    )
+    return [result for result in results if result is not None]
+
+
+def _source_files(paths: list[Path]) -> Iterable[Path]:
+    """Generate the python files in the paths, skipping hidden and cache directories."""
+    for path in paths:
+        if path.is_file():
+            yield path
+            continue
+        for root, directories, files in os.walk(path):
+            directories[:] = [d for d in directories if not d.startswith((".", "__pycache__"))]
+            yield from (Path(root) / file for file in files if file.endswith(".py"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the static conformance scanner from the command line.
+
+    Attributes
+    ----------
+        argv (list[str] | None): command line arguments, `sys.argv` if None.
+
+    Returns
+    -------
+        int: exit code, 1 when `--check` is given and a candidate does not adhere.
+    """
+    parser = argparse.ArgumentParser(
+        prog="annotation-protocol-scan",
+        description="Check classes against annotation protocols without importing them.",
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="source files or directories")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of processes")
+    parser.add_argument("--cache", type=Path, default=Path(DEFAULT_CACHE), help="cache file")
+    parser.add_argument("--no-cache", action="store_true", help="do not use the cache file")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with 1 when a candidate does not adhere to a protocol",
+    )
+    args = parser.parse_args(argv)
+
+    results = scan(args.paths, None if args.no_cache else args.cache, args.jobs)
+    for result in results:
+        if result.adheres:
+            print(f"PASS {result.candidate} adheres to {result.protocol}")  # noqa: T201
+        else:
+            message = f"FAIL {result.candidate} does not adhere to {result.protocol}"
+            print(f"{message}: `{result.attribute}`")  # noqa: T201
+    return int(args.check and not all(result.adheres for result in results))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
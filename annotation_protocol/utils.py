@@ -1,20 +1,35 @@
 import logging
+import sys
 from collections.abc import Generator
-from inspect import Parameter, Signature, _empty, signature
+from functools import lru_cache, partial
+from inspect import Parameter, Signature, _empty, get_annotations, getattr_static, signature
 from types import UnionType
 from typing import (
     Any,
+    ForwardRef,
+    Literal,
     Union,
+    _eval_type,
     _get_protocol_attrs,
     get_args,
     get_origin,
+    get_type_hints,
 )
 
+from .cache import ClassCache, register_clear_hook
+
 logger = logging.getLogger(__name__)
 
 
 UNION_TYPES = (Union, UnionType)
 
+# Resolved signatures of each protocol, data annotations of each class (including those it only
+# adds or overrides) and the data attributes each protocol checks.
+_PROTOCOL_SIGNATURES: ClassCache[dict[str, Signature | None]] = ClassCache()
+_DATA_ANNOTATIONS: ClassCache[dict[str, object]] = ClassCache()
+_OWN_DATA_ANNOTATIONS: ClassCache[dict[str, object]] = ClassCache()
+_PROTOCOL_DATA_ANNOTATIONS: ClassCache[dict[str, object]] = ClassCache()
+
 
 def attributes_to_check(
     protocol: object,
@@ -33,19 +48,88 @@ def attributes_to_check(
     ------
         Generator[tuple[object, Signature], None, None]: _description_
     """
-    protocol_attributes: set[int] = _get_protocol_attrs(protocol)
-    for attr in protocol_attributes.difference(ignore_attributes):
-        try:
-            protocol_attr = getattr(protocol, attr, None)
-            protocol_signature = signature(protocol_attr, eval_str=True)
-        except TypeError:
-            msg = f"{attr} doesn't have annotations in the protocol."
-            logger.debug(msg)
-            continue
-        else:
+    for attr, protocol_signature in get_protocol_signatures(protocol).items():
+        if attr not in ignore_attributes and protocol_signature is not None:
             yield attr, protocol_signature
 
 
+def get_protocol_signatures(protocol: type) -> dict[str, Signature | None]:
+    """Get the signature of each attribute of a protocol.
+
+    Signatures are resolved once for each protocol. A protocol that inherits from other protocols
+    reuses their signatures and only resolves the attributes it adds or overrides.
+
+    Attributes
+    ----------
+        protocol (type): the protocol to get the signatures of.
+
+    Returns
+    -------
+        dict[str, Signature | None]: the signature of each attribute, None if it has none.
+    """
+    return _PROTOCOL_SIGNATURES.get((protocol,), partial(_resolve_protocol_signatures, protocol))
+
+
+def _resolve_protocol_signatures(protocol: type) -> dict[str, Signature | None]:
+    """Resolve the signatures of a protocol, reusing those of its parent protocols."""
+    parents = [
+        (parent, get_protocol_signatures(parent))
+        for parent in protocol.__bases__
+        if getattr(parent, "_is_protocol", False) and isinstance(parent, type(protocol))
+    ]
+    signatures = {}
+    for attr in _get_protocol_attrs(protocol):
+        protocol_attr = getattr_static(protocol, attr, None)
+        for parent, parent_signatures in parents:
+            if attr in parent_signatures and getattr_static(parent, attr, None) is protocol_attr:
+                signatures[attr] = parent_signatures[attr]
+                break
+        else:
+            try:
+                signatures[attr] = signature(getattr(protocol, attr, None), eval_str=True)
+            except TypeError:
+                msg = f"{attr} doesn't have annotations in the protocol."
+                logger.debug(msg)
+                signatures[attr] = None
+    return signatures
+
+
+def data_attributes_to_check(
+    protocol: type,
+    ignore_attributes: set[str],
+) -> dict[str, object]:
+    """Get the data attributes (and their annotation) of protocol that need to be checked.
+
+    Data attributes are the non-callable protocol attributes, which includes properties. Only
+    attributes that have an annotation are returned. The annotations are resolved once for each
+    protocol.
+
+    Attributes
+    ----------
+        protocol (type): the protocol to get data attributes from.
+        ignore_attributes (set[str]): the annotation protocol class specific methods.
+
+    Returns
+    -------
+        dict[str, object]: the annotation of each data attribute.
+    """
+
+    def _resolve() -> dict[str, object]:
+        annotations = get_data_annotations(protocol)
+        return {
+            attr: annotations[attr]
+            for attr in _get_protocol_attrs(protocol)
+            if attr in annotations and not callable(getattr(protocol, attr, None))
+        }
+
+    protocol_annotations = _PROTOCOL_DATA_ANNOTATIONS.get((protocol,), _resolve)
+    return {
+        attr: annotation
+        for attr, annotation in protocol_annotations.items()
+        if attr not in ignore_attributes
+    }
+
+
 def mock_parameters(
     protocol: Signature,
     other: Signature,
@@ -107,9 +191,85 @@ def get_signature(obj: object, attr: object) -> Signature | None:
     return None
 
 
+def get_data_annotations(obj: type) -> dict[str, object]:
+    """Get the resolved annotations of the data attributes and properties of a class.
+
+    Class level annotations are resolved along the MRO, like `get_type_hints` does. Properties
+    contribute the return annotation of their getter. The annotations each class adds or overrides
+    are cached, so a class reuses the annotations resolved for its bases.
+
+    Attributes
+    ----------
+        obj (type): the class to get the annotations from.
+
+    Returns
+    -------
+        dict[str, object]: the annotation of each annotated data attribute.
+    """
+    return _DATA_ANNOTATIONS.get((obj,), lambda: _resolve_data_annotations(obj))
+
+
+def _resolve_data_annotations(obj: type) -> dict[str, object]:
+    """Resolve the data annotations of a class, reusing those resolved for its bases."""
+    annotations = {}
+    for base in reversed(obj.__mro__):
+        own_annotations = partial(_resolve_own_data_annotations, base)
+        annotations.update(_OWN_DATA_ANNOTATIONS.get((base,), own_annotations))
+    return {
+        attr: annotation for attr, annotation in annotations.items() if annotation is not _empty
+    }
+
+
+def _resolve_own_data_annotations(obj: type) -> dict[str, object]:
+    """Resolve the data annotations a class adds or overrides, `_empty` if they are removed."""
+    annotations = {
+        attr: _resolve_annotation(obj, attr, annotation)
+        for attr, annotation in get_annotations(obj).items()
+    }
+
+    for attr, value in vars(obj).items():
+        if not isinstance(value, property):
+            continue
+        try:
+            annotations[attr] = get_type_hints(value.fget, include_extras=True)["return"]
+        except (KeyError, NameError, TypeError):
+            annotations[attr] = _empty
+    return annotations
+
+
+def _resolve_annotation(obj: type, attr: str, annotation: object) -> object:
+    """Resolve a single class annotation, keeping it unresolved when that fails.
+
+    Each annotation is evaluated like `get_type_hints` evaluates it, including forward references
+    nested in generics, e.g. `list["Node"]`. Unlike `get_type_hints`, an annotation that cannot be
+    resolved, e.g. a name only imported under `TYPE_CHECKING`, does not prevent the other
+    annotations of the class from being resolved.
+    """
+    if annotation is None:
+        return type(None)
+    # Like `get_type_hints`, names in the module take precedence over names in the class
+    globalns = dict(vars(obj))
+    localns = getattr(sys.modules.get(obj.__module__), "__dict__", {})
+    if isinstance(annotation, str):
+        forward_ref = ForwardRef(annotation, is_argument=False, is_class=True)
+    else:
+        forward_ref = annotation
+    try:
+        return _eval_type(forward_ref, globalns, localns)
+    except Exception:  # noqa: BLE001
+        msg = f"Could not resolve the annotation of {attr} in {obj}, keeping it unresolved."
+        logger.debug(msg)
+        return annotation
+
+
 def compare_annotations(protocol: object, other: object) -> bool:
     """Compare 2 annotations of protocol and class `other` that should adhere to it.
 
+    Generic annotations, e.g. `dict[str, int | None]`, `Callable[[int], str]` or
+    `Annotated[int, ...]`, are compared recursively, so a subset of the types of a union is allowed
+    at every nesting level. Results are memoized for each pair of hashable annotations, the memo is
+    cleared by `invalidate_all`.
+
     Attributes
     ----------
         protocol (object): The `protocol` that `other` should adhere to
@@ -119,14 +279,44 @@ def compare_annotations(protocol: object, other: object) -> bool:
     -------
         bool: True when annotations of class `other` are also in `protocol`
     """
+    try:
+        hash((protocol, other))
+    except TypeError:
+        # Unhashable annotations, e.g. `Callable` parameter lists, are compared without memo
+        return _compare_annotations(protocol, other)
+    return _compare_annotations_memoized(protocol, other)
+
+
+def _compare_annotations(protocol: object, other: object) -> bool:
+    """Compare 2 annotations structurally, see `compare_annotations`."""
     if protocol in (_empty, Any, None) or other is Any:
         return True
 
+    if get_origin(other) in UNION_TYPES:
+        return all(compare_annotations(protocol, arg) for arg in get_args(other))
     if get_origin(protocol) in UNION_TYPES:
-        protocol_types = set(get_args(protocol))
-        other_types = set(get_args(other)) if get_origin(other) in UNION_TYPES else {other}
-        return protocol_types >= other_types
-    return protocol == other
+        return any(compare_annotations(arg, other) for arg in get_args(protocol))
+    return _compare_generic_annotations(protocol, other)
+
+
+def _compare_generic_annotations(protocol: object, other: object) -> bool:
+    """Compare 2 annotations that are not unions argument by argument."""
+    if isinstance(protocol, list) and isinstance(other, list):
+        # Parameters of a `Callable`
+        return len(protocol) == len(other) and all(map(compare_annotations, protocol, other))
+
+    if (origin := get_origin(protocol)) is None or origin != get_origin(other):
+        return protocol == other
+    if origin is Literal:
+        return set(get_args(protocol)) >= set(get_args(other))
+    protocol_args, other_args = get_args(protocol), get_args(other)
+    return len(protocol_args) == len(other_args) and all(
+        map(compare_annotations, protocol_args, other_args),
+    )
+
+
+_compare_annotations_memoized = lru_cache(maxsize=4096)(_compare_annotations)
+register_clear_hook(_compare_annotations_memoized.cache_clear)
 
 
 def return_annotations_equal(protocol: object, other: object) -> bool:
@@ -208,3 +398,43 @@ def argument_annotations_equal(protocol: object, other: object) -> bool:
             return False
 
     return True
+
+
+def data_annotations_equal(
+    protocol: type,
+    other: type,
+    ignore_attributes: set[str],
+) -> bool:
+    """Compare the annotations of the data attributes of protocol and class `other`.
+
+    Data attributes that are not annotated in `other`, e.g. those only set in `__init__`, cannot be
+    compared and are accepted. The same holds for annotations that could not be resolved and are
+    still strings, in either `protocol` or `other`.
+
+    Attributes
+    ----------
+        protocol (type): The `protocol` that `other` should adhere to
+        other (type): The class `other` that should adhere to the `protocol`
+        ignore_attributes (set[str]): Do not compare these attributes
+
+    Returns
+    -------
+        bool: True if the annotations of all annotated data attributes are equal
+    """
+    other_annotations = get_data_annotations(other)
+    for attr, protocol_annotation in data_attributes_to_check(protocol, ignore_attributes).items():
+        if attr not in other_annotations:
+            continue
+        if isinstance(protocol_annotation, str) or isinstance(other_annotations[attr], str):
+            msg = f"Annotation of data attribute {attr} is unresolved, not comparing it."
+            logger.debug(msg)
+            continue
+        if not compare_annotations(protocol_annotation, other_annotations[attr]):
+            msg = (
+                f"Annotation of data attribute {attr} does not ",
+                "support the type given in protocol: ",
+                f"{protocol_annotation} vs {other_annotations[attr]}",
+            )
+            logger.debug(msg)
+            return False
+    return True
@@ -0,0 +1,154 @@
+import logging
+from collections.abc import Callable, Sequence
+from types import NoneType
+from typing import Annotated, Any, Literal, TypeVar, get_args, get_origin, is_typeddict
+
+from .cache import ClassCache
+from .utils import UNION_TYPES, data_attributes_to_check
+
+logger = logging.getLogger(__name__)
+
+# A validator is a tuple of types for `isinstance`, a predicate on the value, or None when any
+# value is valid.
+Validator = tuple[type, ...] | Callable[[object], bool] | None
+
+_VALIDATORS: ClassCache[dict[str, Validator]] = ClassCache()
+_NUMERIC_TOWER: dict[type, tuple[type, ...]] = {
+    float: (float, int),
+    complex: (complex, float, int),
+}
+
+
+class _Missing:
+    """Value of attributes that are missing from an instance."""
+
+
+_MISSING = _Missing()
+
+
+def compile_validator(annotation: object) -> Validator:
+    """Compile an annotation into a validator of values.
+
+    Unions, including `None`, are flattened into a single tuple of types for `isinstance`.
+    Generic annotations are validated by their origin only, e.g. `list[int]` by `list`. Following
+    the numeric tower of PEP 484, `float` also accepts `int` and `complex` also accepts both.
+    Classes that `isinstance` refuses, i.e. TypedDicts and protocols that are not runtime
+    checkable, accept any value.
+
+    Attributes
+    ----------
+        annotation (object): the annotation to compile.
+
+    Returns
+    -------
+        Validator: tuple of types, predicate, or None when any value is valid.
+    """
+    annotation = _unwrap(annotation)
+    origin = get_origin(annotation)
+    if annotation in (Any, object) or isinstance(annotation, str):
+        return None
+    if annotation is None:
+        return (NoneType,)
+    if origin is Literal:
+        values = get_args(annotation)
+        return lambda value: any(
+            value == literal and type(value) is type(literal) for literal in values
+        )
+    if origin in UNION_TYPES:
+        return _compile_union([compile_validator(arg) for arg in get_args(annotation)])
+    if isinstance(cls := origin or annotation, type) and _supports_isinstance(cls):
+        return _NUMERIC_TOWER.get(cls, (cls,))
+
+    msg = f"Cannot validate values of {annotation}, accepting any value."
+    logger.debug(msg)
+    return None
+
+
+def _supports_isinstance(cls: type) -> bool:
+    """Whether `isinstance` accepts a class, it refuses TypedDicts and non-runtime protocols."""
+    if is_typeddict(cls):
+        return False
+    return not getattr(cls, "_is_protocol", False) or getattr(cls, "_is_runtime_protocol", False)
+
+
+def _unwrap(annotation: object) -> object:
+    """Unwrap `Annotated` annotations and type variables into the annotation to validate."""
+    while True:
+        if get_origin(annotation) is Annotated:
+            annotation = get_args(annotation)[0]
+        elif isinstance(annotation, TypeVar):
+            annotation = annotation.__bound__ or Any
+        else:
+            return annotation
+
+
+def _compile_union(validators: list[Validator]) -> Validator:
+    """Combine the validators of the members of a union."""
+    if None in validators:
+        return None
+    if all(isinstance(validator, tuple) for validator in validators):
+        return tuple(dict.fromkeys(t for validator in validators for t in validator))
+
+    types = tuple(t for validator in validators if isinstance(validator, tuple) for t in validator)
+    predicates = [validator for validator in validators if not isinstance(validator, tuple)]
+    return lambda value: isinstance(value, types) or any(p(value) for p in predicates)
+
+
+def get_validators(protocol: type) -> dict[str, Validator]:
+    """Get the validator of each annotated data attribute of a protocol.
+
+    The validators are compiled once for each protocol.
+
+    Attributes
+    ----------
+        protocol (type): the protocol to get the validators of.
+
+    Returns
+    -------
+        dict[str, Validator]: the validator of each annotated data attribute.
+    """
+    return _VALIDATORS.get(
+        (protocol,),
+        lambda: {
+            attr: compile_validator(annotation)
+            for attr, annotation in sorted(data_attributes_to_check(protocol, set()).items())
+        },
+    )
+
+
+def validate_values(protocol: type, instances: Sequence[object]) -> dict[int, list[str]]:
+    """Validate the values of the annotated data attributes of instances against a protocol.
+
+    Only values are validated, whether the classes of the instances adhere to the protocol is
+    checked with `isinstance`. Each attribute is validated for all instances at once, which is
+    much faster than validating the instances one at a time.
+
+    Attributes
+    ----------
+        protocol (type): The `protocol` whose annotations the values should adhere to
+        instances (Sequence[object]): The instances to validate
+
+    Returns
+    -------
+        dict[int, list[str]]: index of each failing instance with the attributes that failed
+    """
+    failures: dict[int, list[str]] = {}
+    for attr, validator in get_validators(protocol).items():
+        if validator is None:
+            failing = [i for i, instance in enumerate(instances) if not hasattr(instance, attr)]
+        elif isinstance(validator, tuple):
+            failing = [
+                i
+                for i, instance in enumerate(instances)
+                if not isinstance(getattr(instance, attr, _MISSING), validator)
+            ]
+        else:
+            failing = [
+                i
+                for i, instance in enumerate(instances)
+                if (value := getattr(instance, attr, _MISSING)) is _MISSING
+                or not validator(value)
+            ]
+        for i in failing:
+            failures.setdefault(i, []).append(attr)
+    return dict(sorted(failures.items()))
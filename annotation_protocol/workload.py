@@ -0,0 +1,375 @@
+"""Generate synthetic protocols and implementations to test how annotation checks scale.
+
+A `WorkloadSpec` describes the shape of a protocol: the number of methods and data attributes, the
+number and kinds of parameters, the width of the unions in the annotations, whether annotations are
+strings and the depth of the MRO of the implementations. `generate_corpus` builds the protocol with
+an implementation that adheres to it and implementations that each have a single, deliberate
+mismatch. The same corpus feeds `differential_check` and `scaling_curve`.
+
+Run `python -m annotation_protocol.workload` to print the check time against the number of methods.
+"""
+import logging
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from inspect import Parameter
+from time import perf_counter
+from typing import _get_protocol_attrs
+
+from .annotation_protocol import AnnotationProtocol
+from .cache import invalidate_all
+from .check_annotations import check_annotations
+
+logger = logging.getLogger(__name__)
+
+# Annotations to build unions from, with a value of that type
+TYPES = (
+    ("int", "0"),
+    ("str", '""'),
+    ("float", "0.0"),
+    ("bytes", 'b""'),
+    ("complex", "0j"),
+    ("list[int]", "[]"),
+    ("dict[str, int]", "{}"),
+    ("tuple[int, ...]", "()"),
+    ("set[str]", "set()"),
+    ("frozenset[int]", "frozenset()"),
+    ("type[int]", "int"),
+)
+PARAMETER_KINDS = (
+    Parameter.POSITIONAL_ONLY,
+    Parameter.POSITIONAL_OR_KEYWORD,
+    Parameter.KEYWORD_ONLY,
+)
+MISMATCHES = (
+    "annotation",
+    "return",
+    "rename",
+    "missing_parameter",
+    "missing_method",
+    "data",
+)
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    """Shape of a generated protocol and its implementations.
+
+    Attributes
+    ----------
+        n_methods (int): number of methods of the protocol.
+        n_parameters (int): number of parameters of each method, besides `self`.
+        parameter_kinds (tuple[ParameterKind, ...]): kinds the parameters cycle through.
+        union_width (int): number of types in the union of each annotation.
+        string_annotations (bool): whether annotations are strings instead of types.
+        mro_depth (int): number of classes the implementation's attributes are spread over.
+        n_data_attributes (int): number of annotated data attributes of the protocol.
+        seed (int): seed of the random choices of types and mismatch locations.
+    """
+
+    n_methods: int = 10
+    n_parameters: int = 3
+    parameter_kinds: tuple = (Parameter.POSITIONAL_OR_KEYWORD,)
+    union_width: int = 1
+    string_annotations: bool = False
+    mro_depth: int = 1
+    n_data_attributes: int = 0
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class Workload:
+    """A protocol and an implementation with the expected outcome of the check.
+
+    Attributes
+    ----------
+        protocol (type): the generated protocol.
+        implementation (type): the generated class that should be checked against `protocol`.
+        expected (bool): whether `implementation` adheres to `protocol`.
+        mismatch (str | None): the kind of mismatch in `implementation`, if any.
+    """
+
+    protocol: type
+    implementation: type
+    expected: bool
+    mismatch: str | None
+
+
+def generate_corpus(
+    spec: WorkloadSpec,
+    mismatches: tuple[str, ...] = MISMATCHES,
+) -> list[Workload]:
+    """Generate a protocol with a matching implementation and deliberately mismatching ones.
+
+    Mismatches that are not possible for the spec, e.g. renaming a parameter when all parameters
+    are positional-only, are skipped.
+
+    Attributes
+    ----------
+        spec (WorkloadSpec): shape of the protocol.
+        mismatches (tuple[str, ...]): kinds of mismatch to generate an implementation for.
+
+    Returns
+    -------
+        list[Workload]: the matching workload, followed by one workload for each mismatch.
+    """
+    _validate(spec)
+    rng = random.Random(spec.seed)
+    methods = [_random_method(spec, rng) for _ in range(spec.n_methods)]
+    data = [_random_union(spec, rng) for _ in range(spec.n_data_attributes)]
+    protocol = _build_protocol(spec, methods, data)
+
+    implementation = _build_implementation(spec, methods, data, rng)
+    corpus = [Workload(protocol, implementation, expected=True, mismatch=None)]
+    for mismatch in mismatches:
+        if (mismatched := _apply_mismatch(mismatch, methods, data, rng)) is None:
+            msg = f"Mismatch {mismatch} is not possible for {spec}."
+            logger.debug(msg)
+            continue
+        implementation = _build_implementation(spec, *mismatched, rng)
+        corpus.append(Workload(protocol, implementation, expected=False, mismatch=mismatch))
+    return corpus
+
+
+def differential_check(corpus: list[Workload]) -> list[Workload]:
+    """Find the workloads for which a check disagrees with the expected outcome.
+
+    Both `check_annotations` and `isinstance` are compared against the expected outcome.
+
+    Attributes
+    ----------
+        corpus (list[Workload]): the workloads to check.
+
+    Returns
+    -------
+        list[Workload]: the workloads for which any check disagrees.
+    """
+    ignore_attributes = _get_protocol_attrs(AnnotationProtocol)
+    disagreements = []
+    for workload in corpus:
+        check = check_annotations(workload.protocol, workload.implementation, ignore_attributes)
+        instance_check = isinstance(workload.implementation(), workload.protocol)
+        if (check is True) is not workload.expected or instance_check is not workload.expected:
+            disagreements.append(workload)
+    return disagreements
+
+
+def time_check(workload: Workload, number: int = 100, *, cold: bool = False) -> float:
+    """Time the `isinstance` check of a workload.
+
+    Attributes
+    ----------
+        workload (Workload): the workload to time.
+        number (int): number of checks to average over.
+        cold (bool): invalidate all caches before each check, including the memo of annotation
+            comparisons.
+
+    Returns
+    -------
+        float: average time of a single check in seconds.
+    """
+    instance = workload.implementation()
+    total = 0.0
+    for _ in range(number):
+        if cold:
+            invalidate_all()
+        start = perf_counter()
+        isinstance(instance, workload.protocol)
+        total += perf_counter() - start
+    return total / number
+
+
+def scaling_curve(
+    parameter: str,
+    sizes: tuple[int, ...],
+    spec: WorkloadSpec | None = None,
+    number: int = 100,
+    *,
+    cold: bool = False,
+) -> list[tuple[int, float]]:
+    """Time the checks of the generated corpus for different sizes of a spec parameter.
+
+    Attributes
+    ----------
+        parameter (str): name of the `WorkloadSpec` field to vary, e.g. `"n_methods"`.
+        sizes (tuple[int, ...]): values of the parameter.
+        spec (WorkloadSpec | None): spec of the other parameters, the default spec if None.
+        number (int): number of checks to average over for each workload.
+        cold (bool): invalidate all caches before each check, including the memo of annotation
+            comparisons.
+
+    Returns
+    -------
+        list[tuple[int, float]]: each size with the average time of a check in its corpus.
+    """
+    spec = spec or WorkloadSpec()
+    curve = []
+    for size in sizes:
+        corpus = generate_corpus(replace(spec, **{parameter: size}))
+        timings = [time_check(workload, number, cold=cold) for workload in corpus]
+        curve.append((size, sum(timings) / len(timings)))
+    return curve
+
+
+def _validate(spec: WorkloadSpec) -> None:
+    """Raise a ValueError when the spec cannot be generated."""
+    if not 1 <= spec.union_width < len(TYPES):
+        msg = f"union_width should be between 1 and {len(TYPES) - 1}, got {spec.union_width}."
+        raise ValueError(msg)
+    if not spec.parameter_kinds or not set(spec.parameter_kinds) <= set(PARAMETER_KINDS):
+        msg = f"parameter_kinds should be a non-empty subset of {PARAMETER_KINDS}."
+        raise ValueError(msg)
+    if spec.mro_depth < 1:
+        msg = f"mro_depth should be at least 1, got {spec.mro_depth}."
+        raise ValueError(msg)
+
+
+def _random_union(spec: WorkloadSpec, rng: random.Random) -> list[int]:
+    """Pick the indices in `TYPES` of a union."""
+    return sorted(rng.sample(range(len(TYPES)), spec.union_width))
+
+
+def _random_method(spec: WorkloadSpec, rng: random.Random) -> dict:
+    """Pick the parameters and annotations of a method."""
+    kinds = sorted(
+        spec.parameter_kinds[i % len(spec.parameter_kinds)] for i in range(spec.n_parameters)
+    )
+    return {
+        "parameters": [(f"p{i}", kind, _random_union(spec, rng)) for i, kind in enumerate(kinds)],
+        "return": _random_union(spec, rng),
+    }
+
+
+def _apply_mismatch(
+    mismatch: str,
+    methods: list[dict],
+    data: list[list[int]],
+    rng: random.Random,
+) -> tuple[list[dict], list[list[int]]] | None:
+    """Copy the methods and data attributes with a single mismatch, None if not possible."""
+    methods = [{**method, "parameters": list(method["parameters"])} for method in methods]
+    data = list(data)
+    match mismatch:
+        case "annotation" | "rename" | "missing_parameter":
+            candidates = [
+                (method, index)
+                for method in methods
+                for index, (_, kind, _) in enumerate(method["parameters"])
+                if mismatch != "rename" or kind is not Parameter.POSITIONAL_ONLY
+            ]
+            if not candidates:
+                return None
+            method, index = rng.choice(candidates)
+            name, kind, union = method["parameters"][index]
+            if mismatch == "annotation":
+                method["parameters"][index] = (name, kind, [_outside(union, rng)])
+            elif mismatch == "rename":
+                method["parameters"][index] = (f"{name}_renamed", kind, union)
+            else:
+                del method["parameters"][index]
+        case "return" if methods:
+            method = rng.choice(methods)
+            method["return"] = [_outside(method["return"], rng)]
+        case "missing_method" if methods:
+            methods[rng.randrange(len(methods))] = None
+        case "data" if data:
+            index = rng.randrange(len(data))
+            data[index] = [_outside(data[index], rng)]
+        case _:
+            return None
+    return methods, data
+
+
+def _outside(union: list[int], rng: random.Random) -> int:
+    """Pick the index in `TYPES` of a type that is not in the union."""
+    return rng.choice([i for i in range(len(TYPES)) if i not in union])
+
+
+def _annotation(spec: WorkloadSpec, union: list[int]) -> str:
+    """Write the source of the annotation of a union."""
+    annotation = " | ".join(TYPES[i][0] for i in union)
+    return repr(annotation) if spec.string_annotations else annotation
+
+
+def _method_source(
+    spec: WorkloadSpec,
+    name: str,
+    method: dict,
+    union_of: Callable[[list[int]], list[int]],
+) -> str:
+    """Write the source of a method, with the annotation of each union picked by `union_of`."""
+    parameters = ["self"]
+    previous_kind = Parameter.POSITIONAL_ONLY
+    for parameter, kind, union in method["parameters"]:
+        if previous_kind is Parameter.POSITIONAL_ONLY and kind is not Parameter.POSITIONAL_ONLY:
+            parameters.append("/")
+        if kind is Parameter.KEYWORD_ONLY and previous_kind is not Parameter.KEYWORD_ONLY:
+            parameters.append("*")
+        parameters.append(f"{parameter}: {_annotation(spec, union_of(union))}")
+        previous_kind = kind
+    if previous_kind is Parameter.POSITIONAL_ONLY and len(parameters) > 1:
+        parameters.append("/")
+    return_annotation = _annotation(spec, union_of(method["return"]))
+    return f"    def {name}({', '.join(parameters)}) -> {return_annotation}:\n        ...\n"
+
+
+def _build_protocol(spec: WorkloadSpec, methods: list[dict], data: list[list[int]]) -> type:
+    """Build the protocol class."""
+    body = [f"    data_{i}: {_annotation(spec, union)}\n" for i, union in enumerate(data)]
+    body.extend(
+        _method_source(spec, f"method_{i}", method, lambda union: union)
+        for i, method in enumerate(methods)
+    )
+    return _exec_class("GeneratedProtocol", [AnnotationProtocol], body, {})
+
+
+def _build_implementation(
+    spec: WorkloadSpec,
+    methods: list[dict | None],
+    data: list[list[int]],
+    rng: random.Random,
+) -> type:
+    """Build an implementation with its attributes spread over a chain of `mro_depth` classes."""
+
+    def subset(union: list[int]) -> list[int]:
+        return sorted(rng.sample(union, rng.randint(1, len(union))))
+
+    bodies = [[] for _ in range(spec.mro_depth)]
+    for i, union in enumerate(data):
+        union = subset(union)  # noqa: PLW2901
+        bodies[i % spec.mro_depth].append(
+            f"    data_{i}: {_annotation(spec, union)} = {TYPES[union[0]][1]}\n",
+        )
+    for i, method in enumerate(methods):
+        if method is not None:
+            bodies[i % spec.mro_depth].append(_method_source(spec, f"method_{i}", method, subset))
+
+    namespace = {}
+    bases = []
+    for depth, body in enumerate(bodies):
+        bases = [_exec_class(f"Implementation{depth}", bases, body, namespace)]
+    return bases[0]
+
+
+def _exec_class(name: str, bases: list[type], body: list[str], namespace: dict) -> type:
+    """Execute the generated source of a class and return the class."""
+    namespace["__name__"] = __name__
+    namespace.update({base.__name__: base for base in bases})
+    base_names = ", ".join(base.__name__ for base in bases)
+    source = f"class {name}({base_names}):\n{''.join(body) or '    pass'}\n"
+    exec(source, namespace)  # noqa: S102
+    return namespace[name]
+
+
+def main() -> None:
+    """Print the check time against the number of methods, with and without warm caches."""
+    sizes = (1, 10, 100, 1000)
+    cold = scaling_curve("n_methods", sizes, number=10, cold=True)
+    warm = scaling_curve("n_methods", sizes, number=10)
+    print("n_methods  cold [s]   warm [s]")  # noqa: T201
+    for (size, cold_time), (_, warm_time) in zip(cold, warm, strict=True):
+        print(f"{size:>9}  {cold_time:.2e}  {warm_time:.2e}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
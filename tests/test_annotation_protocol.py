@@ -1,6 +1,6 @@
 import unittest
 from collections.abc import Callable
-from typing import Any
+from typing import Annotated, Any, Literal
 
 from annotation_protocol import AnnotationProtocol
 
@@ -401,6 +401,84 @@ class TestAnnotationProtocol(unittest.TestCase):
         assert not isinstance(SupersetUnion(), UnionProto)
         assert not isinstance(MismatchUnion(), UnionProto)
 
+    def test_nested_annotations(self):
+        class Proto(AnnotationProtocol):
+            @staticmethod
+            def f(
+                x: dict[str, int | None],
+                y: Callable[[int | str], tuple[int, ...] | None],
+                z: Annotated[list[int | str], "meta"],
+                w: Literal["a", "b"],
+            ):
+                ...
+
+        class Match:
+            @staticmethod
+            def f(
+                x: dict[str, int | None],
+                y: Callable[[int | str], tuple[int, ...] | None],
+                z: Annotated[list[int | str], "meta"],
+                w: Literal["a", "b"],
+            ):
+                ...
+
+        class SubsetUnions:
+            @staticmethod
+            def f(
+                x: dict[str, int],
+                y: Callable[[int], tuple[int, ...]],
+                z: Annotated[list[str], "meta"],
+                w: Literal["a"],
+            ):
+                ...
+
+        class SupersetUnion(Match):
+            @staticmethod
+            def f(
+                x: dict[str, int | float | None],
+                y: Callable[[int | str], tuple[int, ...] | None],
+                z: Annotated[list[int | str], "meta"],
+                w: Literal["a", "b"],
+            ):
+                ...
+
+        class MismatchCallable(Match):
+            @staticmethod
+            def f(
+                x: dict[str, int | None],
+                y: Callable[[int | str, int], tuple[int, ...] | None],
+                z: Annotated[list[int | str], "meta"],
+                w: Literal["a", "b"],
+            ):
+                ...
+
+        class MismatchMetadata:
+            @staticmethod
+            def f(
+                x: dict[str, int | None],
+                y: Callable[[int | str], tuple[int, ...] | None],
+                z: Annotated[list[int | str], "other"],
+                w: Literal["a", "b"],
+            ):
+                ...
+
+        class MismatchLiteral:
+            @staticmethod
+            def f(
+                x: dict[str, int | None],
+                y: Callable[[int | str], tuple[int, ...] | None],
+                z: Annotated[list[int | str], "meta"],
+                w: Literal["a", "c"],
+            ):
+                ...
+
+        assert isinstance(Match(), Proto)
+        assert isinstance(SubsetUnions(), Proto)
+        assert not isinstance(SupersetUnion(), Proto)
+        assert not isinstance(MismatchCallable(), Proto)
+        assert not isinstance(MismatchMetadata(), Proto)
+        assert not isinstance(MismatchLiteral(), Proto)
+
     def test_return_anotation(self):
         class IntProto(AnnotationProtocol):
             @staticmethod
@@ -451,3 +529,178 @@ class TestAnnotationProtocol(unittest.TestCase):
 
         assert isinstance(Test(), Proto)
         assert isinstance(Test, Proto)
+
+    def test_data_annotations(self):
+        class Proto(AnnotationProtocol):
+            data: int | None
+
+        class Match:
+            data: int | None = None
+
+        class SubsetUnion:
+            data: int = 0
+
+        class Mismatch:
+            data: str = ""
+
+        class MismatchInParent(Mismatch):
+            pass
+
+        class Unannotated:
+            def __init__(self) -> None:
+                self.data = 123
+
+        assert isinstance(Match(), Proto)
+        assert isinstance(SubsetUnion(), Proto)
+        assert not isinstance(Mismatch(), Proto)
+        assert not isinstance(MismatchInParent(), Proto)
+        assert isinstance(Unannotated(), Proto)
+
+    def test_property_annotations(self):
+        class Proto(AnnotationProtocol):
+            @property
+            def data(self) -> int:
+                ...
+
+        class MatchProperty:
+            @property
+            def data(self) -> int:
+                return 0
+
+        class MatchAttribute:
+            data: int = 0
+
+        class MismatchProperty:
+            @property
+            def data(self) -> str:
+                return ""
+
+        class UnannotatedProperty:
+            @property
+            def data(self):
+                return 0
+
+        assert isinstance(MatchProperty(), Proto)
+        assert isinstance(MatchAttribute(), Proto)
+        assert not isinstance(MismatchProperty(), Proto)
+        assert isinstance(UnannotatedProperty(), Proto)
+
+    def test_protocol_inheritance(self):
+        class Parent(AnnotationProtocol):
+            data: int
+
+            @staticmethod
+            def f(x: int) -> int:
+                ...
+
+        class Child(Parent, AnnotationProtocol):
+            @staticmethod
+            def g(x: str) -> str:
+                ...
+
+        class Test:
+            data: int = 0
+
+            @staticmethod
+            def f(x: int) -> int:
+                ...
+
+            @staticmethod
+            def g(x: str) -> str:
+                ...
+
+        class MissingParentMethod:
+            data: int = 0
+
+            @staticmethod
+            def g(x: str) -> str:
+                ...
+
+        class MismatchParentMethod(Test):
+            @staticmethod
+            def f(x: str) -> int:
+                ...
+
+        class MismatchParentData(Test):
+            data: str = ""
+
+        assert isinstance(Test(), Child)
+        assert isinstance(Test(), Parent)
+        assert not isinstance(MissingParentMethod(), Child)
+        assert not isinstance(MismatchParentMethod(), Child)
+        assert not isinstance(MismatchParentData(), Child)
+
+    def test_protocol_inheritance_override(self):
+        class Parent(AnnotationProtocol):
+            @staticmethod
+            def f(x: int) -> int:
+                ...
+
+        class Child(Parent, AnnotationProtocol):
+            @staticmethod
+            def f(x: int | str) -> int:
+                ...
+
+        class Test:
+            @staticmethod
+            def f(x: str) -> int:
+                ...
+
+        assert isinstance(Test(), Child)
+        assert not isinstance(Test(), Parent)
+
+    def test_nominal_implementation(self):
+        class Proto(AnnotationProtocol):
+            @staticmethod
+            def f(x: int) -> int:
+                ...
+
+        class Implementation(Proto):
+            @staticmethod
+            def f(x: int) -> int:
+                return x
+
+        class Unrelated:
+            @staticmethod
+            def f(x: int) -> int:
+                return x
+
+        assert Implementation.f(1) == 1
+        assert isinstance(Implementation(), Proto)
+        assert isinstance(Unrelated(), Proto)
+        assert not isinstance(Unrelated(), Implementation)
+        assert not issubclass(Unrelated, Implementation)
+
+    def test_unresolved_data_annotations(self):
+        class Proto(AnnotationProtocol):
+            data: "int"
+            unresolved: "Undefined"  # noqa: F821
+
+        class Match:
+            data: "int" = 0
+            unresolved: int = 0
+            other: "Undefined" = None  # noqa: F821
+
+        class Mismatch:
+            data: "str" = ""
+            unresolved: int = 0
+            other: "Undefined" = None  # noqa: F821
+
+        assert isinstance(Match(), Proto)
+        assert not isinstance(Mismatch(), Proto)
+
+    def test_nested_forward_references(self):
+        class Proto(AnnotationProtocol):
+            data: list["int"]
+            mapping: dict[str, "int | None"]
+
+        class Match:
+            data: list[int] = []  # noqa: RUF012
+            mapping: "dict[str, int]" = {}  # noqa: RUF012
+
+        class Mismatch:
+            data: list[str] = []  # noqa: RUF012
+            mapping: "dict[str, int]" = {}  # noqa: RUF012
+
+        assert isinstance(Match(), Proto)
+        assert not isinstance(Mismatch(), Proto)
@@ -0,0 +1,144 @@
+import gc
+import unittest
+import weakref
+
+from annotation_protocol import (
+    AnnotationProtocol,
+    invalidate,
+    invalidate_all,
+    set_development_mode,
+)
+from annotation_protocol.utils import _compare_annotations_memoized, compare_annotations
+
+
+class TestCache(unittest.TestCase):
+    def tearDown(self):
+        set_development_mode(enabled=False)
+
+    @staticmethod
+    def make_classes():
+        class Proto(AnnotationProtocol):
+            @staticmethod
+            def f(x: int) -> int:
+                ...
+
+        class Test:
+            @staticmethod
+            def f(x: int) -> int:
+                ...
+
+        return Proto, Test
+
+    def test_outcome_is_cached(self):
+        Proto, Test = self.make_classes()
+        assert isinstance(Test(), Proto)
+
+        Test.f = staticmethod(lambda x: x)
+        assert isinstance(Test(), Proto)
+
+    def test_parent_outcome_is_recorded(self):
+        Parent, Test = self.make_classes()
+
+        class Child(Parent, AnnotationProtocol):
+            pass
+
+        assert isinstance(Test(), Child)
+
+        Test.f = staticmethod(lambda x: x)
+        assert isinstance(Test(), Parent)
+
+    def test_invalidate(self):
+        Proto, Test = self.make_classes()
+
+        class Child(Test):
+            pass
+
+        assert isinstance(Child(), Proto)
+        assert issubclass(Child, Proto)
+
+        def f(x: str) -> int:
+            return len(x)
+
+        Test.f = staticmethod(f)
+        invalidate(Test)
+        assert not isinstance(Child(), Proto)
+        assert not issubclass(Child, Proto)
+
+    def test_invalidate_all(self):
+        class Proto(AnnotationProtocol):
+            data: int
+
+        class Test:
+            data: int = 0
+
+        assert isinstance(Test(), Proto)
+
+        Test.__annotations__["data"] = str
+        invalidate_all()
+        assert not isinstance(Test(), Proto)
+
+    def test_invalidate_all_clears_memo(self):
+        assert compare_annotations(int | None, int)
+        assert _compare_annotations_memoized.cache_info().currsize > 0
+
+        invalidate_all()
+        assert _compare_annotations_memoized.cache_info().currsize == 0
+
+    def test_development_mode(self):
+        set_development_mode(enabled=True)
+        Proto, Test = self.make_classes()
+        assert isinstance(Test(), Proto)
+        assert issubclass(Test, Proto)
+
+        def f(x: str) -> int:
+            return len(x)
+
+        original = Test.f
+        Test.f = staticmethod(f)
+        assert not isinstance(Test(), Proto)
+        assert not issubclass(Test, Proto)
+
+        Test.f = staticmethod(original)
+        assert isinstance(Test(), Proto)
+        assert issubclass(Test, Proto)
+
+    def test_development_mode_reassigned_attribute(self):
+        set_development_mode(enabled=True)
+        Proto, Test = self.make_classes()
+
+        def good(x: int) -> int:
+            return x
+
+        def bad(x: str) -> int:
+            return len(x)
+
+        Test.f = staticmethod(good)
+        assert isinstance(Test(), Proto)
+
+        for _ in range(100):
+            del Test.f
+            Test.f = staticmethod(bad)
+            assert not isinstance(Test(), Proto)
+            del Test.f
+            Test.f = staticmethod(good)
+            assert isinstance(Test(), Proto)
+
+    def test_development_mode_does_not_keep_classes_alive(self):
+        set_development_mode(enabled=True)
+        Proto, Test = self.make_classes()
+
+        class Child(Test):
+            def __init__(self) -> None:
+                super().__init__()
+
+            @property
+            def name(self) -> str:
+                return super().__repr__()
+
+        assert isinstance(Child(), Proto)
+        assert issubclass(Child, Proto)
+
+        references = [weakref.ref(Proto), weakref.ref(Test), weakref.ref(Child)]
+        del Proto, Test, Child
+        gc.collect()
+        assert all(reference() is None for reference in references)
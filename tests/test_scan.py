@@ -0,0 +1,292 @@
+import importlib
+import json
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from annotation_protocol.scan import ScanResult, main, scan
+
+PROTOCOLS = """
+from collections.abc import Callable
+
+from annotation_protocol import AnnotationProtocol
+
+from .types import Vector
+
+
+class Proto(AnnotationProtocol):
+    data: int | None
+
+    def f(self, x: dict[str, int | None], /, y: "Vector", *, z: Callable[[int], str]) -> int:
+        ...
+
+    @classmethod
+    def make(cls) -> "Proto | None":
+        ...
+
+
+class Child(Proto, AnnotationProtocol):
+    @property
+    def size(self) -> int:
+        ...
+"""
+
+IMPLEMENTATIONS = """
+from collections.abc import Callable
+
+from scanned_pkg import Vector
+from scanned_pkg.protocols import Proto
+
+
+class Good:
+    data: int = 0
+
+    def f(self, x: dict[str, int], /, y: Vector, *, z: Callable[[int], str]) -> int:
+        ...
+
+    @classmethod
+    def make(cls) -> Proto:
+        ...
+
+
+class GoodChild(Good):
+    def __init__(self) -> None:
+        self.size = 3
+
+
+class BadData(Good):
+    data: str = ""
+
+
+class BadMethod(Good):
+    def f(self, x: dict[str, str], /, y: Vector, *, z: Callable[[int], str]) -> int:
+        ...
+
+
+class RenamedParameter(Good):
+    def f(self, x: dict[str, int], /, v: Vector, *, z: Callable[[int], str]) -> int:
+        ...
+
+
+class NotAClassmethod(Good):
+    def make(cls) -> Proto:
+        ...
+
+
+class Nominal(Proto):
+    data: int = 0
+
+
+class Unrelated:
+    def f(self):
+        ...
+"""
+
+COLORS = """
+from enum import Enum
+from typing import Literal
+
+from annotation_protocol import AnnotationProtocol
+
+
+class Color(Enum):
+    RED = 1
+    BLUE = 2
+    GREEN = 3
+
+
+class ColorProto(AnnotationProtocol):
+    color: Literal[Color.RED, Color.BLUE]
+
+
+class Red:
+    color: Literal[Color.RED] = Color.RED
+
+
+class Green:
+    color: Literal[Color.GREEN] = Color.GREEN
+"""
+
+OTHER_COLORS = """
+from enum import Enum
+from typing import Literal
+
+
+class Color(Enum):
+    RED = 1
+
+
+class OtherRed:
+    color: Literal[Color.RED] = Color.RED
+"""
+
+ALIASES = """
+from typing import TypeAlias
+
+from annotation_protocol import AnnotationProtocol
+
+IntOrStr = int | str
+Numbers: TypeAlias = list[IntOrStr]
+Tree = list["Tree"] | None
+
+
+class AliasProto(AnnotationProtocol):
+    def convert(self, x: int | str) -> list[int | str]:
+        ...
+
+
+class Aliased:
+    def convert(self, x: IntOrStr) -> Numbers:
+        ...
+
+
+class Mismatch:
+    def convert(self, x: IntOrStr) -> Tree:
+        ...
+"""
+
+LATIN = """# -*- coding: latin-1 -*-
+from annotation_protocol import AnnotationProtocol
+
+
+class LatinProto(AnnotationProtocol):
+    name: str
+
+
+class Latin:
+    name: str = "café"
+"""
+
+UTIL_PROTOCOL = """
+from annotation_protocol import AnnotationProtocol
+
+
+class UtilProto(AnnotationProtocol):
+    def f(self, x: int) -> int:
+        ...
+"""
+
+UTIL_IMPLEMENTATION = """
+class Implementation:
+    def f(self, x: str) -> int:
+        ...
+"""
+
+
+class TestScan(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        package = self.root / "scanned_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("from .types import Vector\n")
+        (package / "types.py").write_text("class Vector:\n    pass\n")
+        (package / "protocols.py").write_text(textwrap.dedent(PROTOCOLS))
+        (package / "implementations.py").write_text(textwrap.dedent(IMPLEMENTATIONS))
+
+    def tearDown(self):
+        for module in [m for m in sys.modules if m.startswith("scanned_pkg")]:
+            del sys.modules[module]
+        self.directory.cleanup()
+
+    def test_scan(self):
+        results = scan([self.root], jobs=1)
+
+        protocol, child = "scanned_pkg.protocols.Proto", "scanned_pkg.protocols.Child"
+        module = "scanned_pkg.implementations"
+        assert results == [
+            ScanResult(child, f"{module}.GoodChild", adheres=True),
+            ScanResult(protocol, f"{module}.BadData", adheres=False, attribute="data"),
+            ScanResult(protocol, f"{module}.BadMethod", adheres=False, attribute="f"),
+            ScanResult(protocol, f"{module}.Good", adheres=True),
+            ScanResult(protocol, f"{module}.GoodChild", adheres=True),
+            ScanResult(protocol, f"{module}.Nominal", adheres=True),
+            ScanResult(protocol, f"{module}.NotAClassmethod", adheres=False, attribute="make"),
+            ScanResult(protocol, f"{module}.RenamedParameter", adheres=False, attribute="f"),
+        ]
+
+    def assert_agrees_with_isinstance(self, results):
+        sys.path.insert(0, str(self.root))
+        try:
+            for result in results:
+                protocol_module, _, protocol = result.protocol.rpartition(".")
+                candidate_module, _, candidate = result.candidate.rpartition(".")
+                protocol = getattr(importlib.import_module(protocol_module), protocol)
+                candidate = getattr(importlib.import_module(candidate_module), candidate)
+                assert isinstance(candidate(), protocol) is result.adheres, result
+        finally:
+            sys.path.remove(str(self.root))
+
+    def test_literal_of_enum(self):
+        (self.root / "scanned_pkg" / "colors.py").write_text(textwrap.dedent(COLORS))
+        (self.root / "scanned_pkg" / "other_colors.py").write_text(textwrap.dedent(OTHER_COLORS))
+
+        results = scan([self.root / "scanned_pkg"], jobs=1)
+
+        protocol, module = "scanned_pkg.colors.ColorProto", "scanned_pkg.colors"
+        other_red = "scanned_pkg.other_colors.OtherRed"
+        assert [result for result in results if result.protocol == protocol] == [
+            ScanResult(protocol, f"{module}.Green", adheres=False, attribute="color"),
+            ScanResult(protocol, f"{module}.Red", adheres=True),
+            ScanResult(protocol, other_red, adheres=False, attribute="color"),
+        ]
+        self.assert_agrees_with_isinstance(results)
+
+    def test_type_aliases(self):
+        (self.root / "scanned_pkg" / "aliases.py").write_text(textwrap.dedent(ALIASES))
+
+        results = scan([self.root / "scanned_pkg"], jobs=1)
+
+        protocol, module = "scanned_pkg.aliases.AliasProto", "scanned_pkg.aliases"
+        assert [result for result in results if result.protocol == protocol] == [
+            ScanResult(protocol, f"{module}.Aliased", adheres=True),
+            ScanResult(protocol, f"{module}.Mismatch", adheres=False, attribute="convert"),
+        ]
+        self.assert_agrees_with_isinstance(results)
+
+    def test_same_module_names(self):
+        for directory, source in [("a", UTIL_PROTOCOL), ("b", UTIL_IMPLEMENTATION)]:
+            (self.root / directory).mkdir()
+            (self.root / directory / "util.py").write_text(textwrap.dedent(source))
+
+        with self.assertLogs("annotation_protocol.scan", "WARNING"):
+            results = scan([self.root / "a", self.root / "b"], jobs=1)
+
+        assert results == [
+            ScanResult("util.UtilProto", "b.util.Implementation", adheres=False, attribute="f"),
+        ]
+
+    def test_coding_declaration(self):
+        (self.root / "scanned_pkg" / "latin.py").write_bytes(LATIN.encode("latin-1"))
+
+        results = scan([self.root], jobs=1)
+
+        module = "scanned_pkg.latin"
+        assert ScanResult(f"{module}.LatinProto", f"{module}.Latin", adheres=True) in results
+
+    def test_scan_agrees_with_isinstance(self):
+        self.assert_agrees_with_isinstance(scan([self.root], jobs=2))
+
+    def test_cache(self):
+        cache_path = self.root / "cache.json"
+        scan([self.root], cache_path=cache_path, jobs=1)
+
+        # Unchanged files are not parsed again, so the cached summary is used
+        cache = json.loads(cache_path.read_text())
+        implementations = str(self.root / "scanned_pkg" / "implementations.py")
+        del cache["files"][implementations]["summary"]["classes"]["BadData"]
+        cache_path.write_text(json.dumps(cache))
+        candidates = {result.candidate for result in scan([self.root], cache_path=cache_path)}
+        assert "scanned_pkg.implementations.BadData" not in candidates
+
+        # Changed files are parsed again
+        with Path(implementations).open("a") as f:
+            f.write("\n")
+        candidates = {result.candidate for result in scan([self.root], cache_path=cache_path)}
+        assert "scanned_pkg.implementations.BadData" in candidates
+
+    def test_main(self):
+        assert main([str(self.root), "--no-cache", "-j", "1"]) == 0
+        assert main([str(self.root), "--no-cache", "-j", "1", "--check"]) == 1
@@ -0,0 +1,118 @@
+import unittest
+from typing import Annotated, Any, Literal, Protocol, TypedDict
+
+from annotation_protocol import AnnotationProtocol, validate_values
+
+
+class TestValidateValues(unittest.TestCase):
+    def test_validate_values(self):
+        class Proto(AnnotationProtocol):
+            number: int | None
+            names: list[str]
+            mode: Literal["a", "b"]
+            meta: Annotated[float, "unit"]
+            anything: Any
+
+        class Test:
+            def __init__(self, number, names, mode="a", meta=0.0) -> None:
+                self.number = number
+                self.names = names
+                self.mode = mode
+                self.meta = meta
+                self.anything = object()
+
+        class Missing:
+            number = 1
+
+        instances = [
+            Test(1, []),
+            Test(None, ["x"]),
+            Test("1", []),
+            Test(1, (), mode="c", meta=1),
+            Test(1, [], meta=1j),
+            Missing(),
+        ]
+
+        assert validate_values(Proto, instances) == {
+            2: ["number"],
+            3: ["mode", "names"],
+            4: ["meta"],
+            5: ["anything", "meta", "mode", "names"],
+        }
+        assert validate_values(Proto, []) == {}
+
+    def test_properties(self):
+        class Proto(AnnotationProtocol):
+            @property
+            def data(self) -> int | None:
+                ...
+
+        class Test:
+            def __init__(self, data) -> None:
+                self.data = data
+
+        assert validate_values(Proto, [Test(1), Test(None), Test(1.0)]) == {2: ["data"]}
+
+    def test_annotations_refusing_isinstance(self):
+        class Mapping(TypedDict):
+            x: int
+
+        class PlainProto(Protocol):
+            def f(self) -> int:
+                ...
+
+        class Proto(AnnotationProtocol, check_values=True):
+            mapping: Mapping
+            plain: PlainProto
+            data: int
+
+        class Test:
+            mapping: Mapping
+            plain: PlainProto
+            data: int
+
+            def __init__(self, data) -> None:
+                self.mapping = {"x": 1}
+                self.plain = object()
+                self.data = data
+
+        assert validate_values(Proto, [Test(1), Test("1")]) == {1: ["data"]}
+        assert isinstance(Test(1), Proto)
+        assert not isinstance(Test("1"), Proto)
+
+    def test_check_values(self):
+        class Proto(AnnotationProtocol, check_values=True):
+            data: int
+
+        class StructureOnlyProto(AnnotationProtocol):
+            data: int
+
+        class Test:
+            data: int
+
+            def __init__(self, data) -> None:
+                self.data = data
+
+        assert isinstance(Test(1), Proto)
+        assert not isinstance(Test("1"), Proto)
+        assert isinstance(Test("1"), StructureOnlyProto)
+
+    def test_check_values_is_inherited(self):
+        class Proto(AnnotationProtocol, check_values=True):
+            data: int
+
+        class Child(Proto, AnnotationProtocol):
+            pass
+
+        class StructureOnlyChild(Proto, AnnotationProtocol, check_values=False):
+            pass
+
+        class Test:
+            data: int
+
+            def __init__(self, data) -> None:
+                self.data = data
+
+        assert isinstance(Test(1), Child)
+        assert not isinstance(Test("1"), Child)
+        assert isinstance(Test("1"), StructureOnlyChild)
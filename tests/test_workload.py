@@ -0,0 +1,53 @@
+import unittest
+from inspect import Parameter
+
+from annotation_protocol.workload import (
+    MISMATCHES,
+    WorkloadSpec,
+    differential_check,
+    generate_corpus,
+    scaling_curve,
+)
+
+
+class TestWorkload(unittest.TestCase):
+    def test_corpus(self):
+        corpus = generate_corpus(WorkloadSpec(n_data_attributes=1))
+
+        assert [workload.mismatch for workload in corpus] == [None, *MISMATCHES]
+        assert [workload.expected for workload in corpus] == [True] + [False] * len(MISMATCHES)
+
+    def test_impossible_mismatches_are_skipped(self):
+        spec = WorkloadSpec(parameter_kinds=(Parameter.POSITIONAL_ONLY,))
+        mismatches = [workload.mismatch for workload in generate_corpus(spec)]
+
+        assert "rename" not in mismatches
+        assert "data" not in mismatches
+
+    def test_invalid_spec(self):
+        with self.assertRaises(ValueError):
+            generate_corpus(WorkloadSpec(union_width=0))
+        with self.assertRaises(ValueError):
+            generate_corpus(WorkloadSpec(parameter_kinds=(Parameter.VAR_POSITIONAL,)))
+
+    def test_differential_check(self):
+        kinds = (
+            Parameter.POSITIONAL_ONLY,
+            Parameter.POSITIONAL_OR_KEYWORD,
+            Parameter.KEYWORD_ONLY,
+        )
+        specs = [
+            WorkloadSpec(),
+            WorkloadSpec(n_parameters=0, n_data_attributes=2),
+            WorkloadSpec(n_parameters=5, parameter_kinds=kinds, union_width=3, seed=1),
+            WorkloadSpec(union_width=4, string_annotations=True, n_data_attributes=3, seed=2),
+            WorkloadSpec(n_methods=20, mro_depth=4, n_data_attributes=4, seed=3),
+        ]
+        for spec in specs:
+            assert differential_check(generate_corpus(spec)) == []
+
+    def test_scaling_curve(self):
+        curve = scaling_curve("n_methods", (1, 5), number=2, cold=True)
+
+        assert [size for size, _ in curve] == [1, 5]
+        assert all(time > 0 for _, time in curve)